@@ -50,11 +50,45 @@ import websockets
 import json
 import sys
 import argparse
-import signal
 import urllib.request
 import urllib.parse
 import urllib.error
 
+# Optional libuv-based event loop (not available on Windows)
+uvloop = None
+if sys.platform != 'win32':
+    try:
+        import uvloop
+    except ImportError:
+        pass
+
+# Optional fast JSON codec: orjson, then ujson, then stdlib json
+try:
+    import orjson
+
+    json_loads = orjson.loads
+    JSONDecodeError = orjson.JSONDecodeError
+
+    def json_dumps(obj):
+        """Serialize obj to compact JSON text"""
+        return orjson.dumps(obj).decode('utf-8')
+except ImportError:
+    try:
+        import ujson
+
+        json_loads = ujson.loads
+        JSONDecodeError = ValueError
+
+        def json_dumps(obj):
+            """Serialize obj to compact JSON text"""
+            return ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False)
+    except ImportError:
+        json_loads = json.loads
+        JSONDecodeError = json.JSONDecodeError
+
+        # Reuse one encoder; json.dumps() builds a new one per call with custom separators
+        json_dumps = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False).encode
+
 # ANSI color codes
 class Colors:
     RESET = '\033[0m'
@@ -78,54 +112,186 @@ def colorize(text, color, use_color=True):
         return text
     return f"{color}{text}{Colors.RESET}"
 
-def format_log_message(log_data, use_color=True):
-    """Format a log message for display"""
-    # Extract fields
-    timestamp_ms = log_data.get('timestamp', 0)
+# Numeric priority per log level (higher is more severe)
+LEVEL_PRIORITY = {
+    'DEBUG': 0,
+    'INFO': 1,
+    'WARN': 2,
+    'ERROR': 3,
+    'FATAL': 4
+}
+
+# Color per log level
+LEVEL_COLORS = {
+    'DEBUG': Colors.DEBUG,
+    'INFO': Colors.INFO,
+    'WARN': Colors.WARN,
+    'ERROR': Colors.ERROR,
+    'FATAL': Colors.FATAL
+}
+
+# Pre-rendered "[LEVEL]" tags for colored and plain output
+LEVEL_TAGS_COLOR = {level: f"[{color}{level}{Colors.RESET}]" for level, color in LEVEL_COLORS.items()}
+LEVEL_TAGS_PLAIN = {level: f"[{level}]" for level in LEVEL_COLORS}
+
+# Module-level copies of the colors used on every formatted line
+_TIMESTAMP = Colors.TIMESTAMP
+_COMPONENT = Colors.COMPONENT
+_EVENT = Colors.EVENT
+_RESET = Colors.RESET
+
+# Data field marker as emitted by the ESP32 (always the last field)
+DATA_TOKEN = b',"data":'
+
+def get_raw_data_field(message):
+    """
+    Slice the "data" value verbatim out of a raw log message
+
+    Args:
+        message: Raw JSON bytes as received from the ESP32
+
+    Returns:
+        str with the data JSON text, or None if it cannot be located
+    """
+    start = message.find(DATA_TOKEN)
+    end = message.rfind(b'}')
+    if start < 0 or end <= start:
+        return None
+    return message[start + len(DATA_TOKEN):end].decode('utf-8', 'replace')
+
+def format_data_suffix(data, raw_message=None):
+    """Format the " <data>" suffix of a log line, or "" if there is no data"""
+    if not data:
+        return ""
+    data_str = get_raw_data_field(raw_message) if raw_message is not None else None
+    if data_str is None:
+        data_str = json_dumps(data)
+    return f" {data_str}"
+
+def format_log_message_color(log_data, raw_message=None):
+    """Format a log message for display with ANSI colors"""
+    level = log_data.get('level', 'UNKNOWN')
+    level_tag = LEVEL_TAGS_COLOR.get(level)
+    if level_tag is None:
+        level_tag = f"[{_RESET}{level}{_RESET}]"
+
+    timestamp_sec = log_data.get('timestamp', 0) / 1000.0
+    return (
+        f"{_TIMESTAMP}{timestamp_sec:>10.3f}s{_RESET} {level_tag} "
+        f"{_COMPONENT}{log_data.get('component', 'Unknown')}{_RESET}:"
+        f"{_EVENT}{log_data.get('event', 'Unknown')}{_RESET}"
+        f"{format_data_suffix(log_data.get('data'), raw_message)}"
+    )
+
+def format_log_message_plain(log_data, raw_message=None):
+    """Format a log message for display without colors"""
     level = log_data.get('level', 'UNKNOWN')
-    component = log_data.get('component', 'Unknown')
-    event = log_data.get('event', 'Unknown')
-    data = log_data.get('data', {})
-
-    # Convert timestamp to readable format
-    timestamp_sec = timestamp_ms / 1000.0
-    time_str = f"{timestamp_sec:>10.3f}s"
-
-    # Color-code log level
-    level_colors = {
-        'DEBUG': Colors.DEBUG,
-        'INFO': Colors.INFO,
-        'WARN': Colors.WARN,
-        'ERROR': Colors.ERROR,
-        'FATAL': Colors.FATAL
-    }
-    level_color = level_colors.get(level, Colors.RESET)
-
-    # Format output
-    formatted = (
-        f"{colorize(time_str, Colors.TIMESTAMP, use_color)} "
-        f"[{colorize(level, level_color, use_color)}] "
-        f"{colorize(component, Colors.COMPONENT, use_color)}:"
-        f"{colorize(event, Colors.EVENT, use_color)}"
+    level_tag = LEVEL_TAGS_PLAIN.get(level)
+    if level_tag is None:
+        level_tag = f"[{level}]"
+
+    timestamp_sec = log_data.get('timestamp', 0) / 1000.0
+    return (
+        f"{timestamp_sec:>10.3f}s {level_tag} "
+        f"{log_data.get('component', 'Unknown')}:{log_data.get('event', 'Unknown')}"
+        f"{format_data_suffix(log_data.get('data'), raw_message)}"
     )
 
-    # Add data if present
-    if data:
-        data_str = json.dumps(data, separators=(',', ':'))
-        formatted += f" {data_str}"
+def format_log_message(log_data, use_color=True, raw_message=None):
+    """
+    Format a log message for display
 
-    return formatted
+    If raw_message (the received JSON bytes) is given, the data field is
+    copied from it verbatim instead of being re-serialized.
+    """
+    if use_color:
+        return format_log_message_color(log_data, raw_message)
+    return format_log_message_plain(log_data, raw_message)
 
 def get_log_level_priority(level):
     """Get numeric priority for log level"""
-    priorities = {
-        'DEBUG': 0,
-        'INFO': 1,
-        'WARN': 2,
-        'ERROR': 3,
-        'FATAL': 4
-    }
-    return priorities.get(level, -1)
+    return LEVEL_PRIORITY.get(level, -1)
+
+def get_admitted_levels(min_priority):
+    """Get the set of log levels that pass the client-side level filter"""
+    return frozenset(
+        level for level, priority in LEVEL_PRIORITY.items()
+        if priority >= min_priority
+    )
+
+# Level field marker as emitted by the ESP32 (compact JSON, no whitespace)
+LEVEL_TOKEN = b'"level":"'
+
+# Every ESP32 log message starts with its timestamp field
+LOG_MESSAGE_PREFIX = b'{"timestamp":'
+
+def get_admitted_level_tokens(min_priority):
+    """
+    Get raw level tokens that pass the client-side level filter
+
+    Used to reject messages before JSON decoding: an ESP32 log message that
+    contains none of these tokens is below the filter level.
+
+    Args:
+        min_priority: Minimum log level priority to display
+
+    Returns:
+        tuple of b'"level":"<LEVEL>"' tokens, or empty tuple if nothing is filtered
+    """
+    if min_priority <= 0:
+        return ()
+    return tuple(
+        LEVEL_TOKEN + level.encode('ascii') + b'"'
+        for level, priority in LEVEL_PRIORITY.items()
+        if priority >= min_priority
+    )
+
+# Level tokens for every known log level
+KNOWN_LEVEL_TOKENS = tuple(LEVEL_TOKEN + level.encode('ascii') + b'"' for level in LEVEL_PRIORITY)
+
+class OutputBuffer:
+    """
+    Buffered stdout writer for the log stream
+
+    Lines are written to the binary stdout buffer without flushing; a flush is
+    scheduled on the event loop and runs once the receive loop has drained all
+    queued frames and goes back to waiting on the socket. A burst of messages
+    costs a single write() syscall instead of one per line.
+    """
+
+    def __init__(self, stream=None):
+        self.stream = stream if stream is not None else sys.stdout
+        self._buffer = self.stream.buffer
+        self._encoding = self.stream.encoding or 'utf-8'
+        self._flush_handle = None
+
+        # Push out any pending text so buffered lines stay in order
+        self.stream.flush()
+
+    def write_line(self, line):
+        """Queue one line of text output and schedule a flush"""
+        self._buffer.write(line.encode(self._encoding, 'replace'))
+        self._buffer.write(b'\n')
+        self._schedule_flush()
+
+    def write_raw(self, data):
+        """Queue raw bytes as one line of output and schedule a flush"""
+        self._buffer.write(data)
+        if not data.endswith(b'\n'):
+            self._buffer.write(b'\n')
+        self._schedule_flush()
+
+    def _schedule_flush(self):
+        # Runs on the next loop iteration, i.e. when recv() has to wait for data
+        if self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_soon(self.flush)
+
+    def flush(self):
+        """Write all queued output now"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._buffer.flush()
 
 def get_server_filter(host, port, use_color=True):
     """
@@ -245,14 +411,20 @@ def set_server_filter(host, port, level=None, components=None, events=None, use_
 async def receive_logs(uri, args, use_color, min_priority):
     """Connect to WebSocket and receive log messages"""
     packets_received = 0
+    out = OutputBuffer()
+    admitted_levels = get_admitted_levels(min_priority)
+    admitted_tokens = get_admitted_level_tokens(min_priority)
 
     try:
-        # Connect with increased timeouts and ping interval
+        # Connect with keepalive, a short close timeout and log-stream tuned limits
         async with websockets.connect(
             uri,
             ping_interval=20,  # Send ping every 20 seconds
             ping_timeout=60,   # Wait 60 seconds for pong
-            close_timeout=10   # Wait 10 seconds for close handshake
+            close_timeout=1,   # Give up on the close handshake after 1 second
+            max_queue=1024,    # Buffer log bursts locally instead of stalling the ESP32
+            max_size=65536,    # Log frames are small JSON objects
+            compression=None   # Don't negotiate permessage-deflate for small frames
         ) as websocket:
             print(f"{colorize('Connected to', Colors.BOLD, use_color)} {uri}")
             if args.level or args.components or args.events:
@@ -260,46 +432,73 @@ async def receive_logs(uri, args, use_color, min_priority):
             print(f"{colorize('Client-side filter:', Colors.BOLD, use_color)} {args.filter}+ (additional filtering)")
             print(f"{colorize('Press Ctrl+C to exit', Colors.BOLD, use_color)}\n")
 
-            async for message in websocket:
+            # Bind loop invariants to locals for the per-frame hot path
+            recv = websocket.recv
+            loads = json_loads
+            write_line = out.write_line
+            write_raw = out.write_raw
+            json_mode = args.json
+            format_message = format_log_message_color if use_color else format_log_message_plain
+
+            # --json without a client-side filter forwards log frames undecoded
+            passthrough = json_mode and min_priority <= 0
+
+            while True:
+                # Receive frames as raw bytes; the JSON decoder reads UTF-8 directly
+                try:
+                    message = await recv(decode=False)
+                except websockets.exceptions.ConnectionClosedOK:
+                    break
                 packets_received += 1
 
+                # Reject below-filter messages without decoding them
+                if (admitted_tokens and message.startswith(LOG_MESSAGE_PREFIX)
+                        and not any(token in message for token in admitted_tokens)):
+                    continue
+
+                # Forward firmware log messages with a known level undecoded
+                if (passthrough and message.startswith(LOG_MESSAGE_PREFIX)
+                        and any(token in message for token in KNOWN_LEVEL_TOKENS)):
+                    write_raw(message)
+                    continue
+
                 try:
                     # Parse JSON message
-                    log_data = json.loads(message.strip())
+                    log_data = loads(message)
 
                     # Handle connection status message
                     if 'status' in log_data and log_data['status'] == 'connected':
-                        if not args.json:
-                            print(f"{colorize('WebSocket handshake complete', Colors.BOLD, use_color)}\n")
+                        if not json_mode:
+                            write_line(f"{colorize('WebSocket handshake complete', Colors.BOLD, use_color)}\n")
                         continue
 
                     # Filter by log level
-                    log_level = log_data.get('level', 'UNKNOWN')
-                    log_priority = get_log_level_priority(log_level)
-
-                    if log_priority < min_priority:
+                    if log_data.get('level') not in admitted_levels:
                         continue  # Skip logs below filter level
 
                     # Output
-                    if args.json:
-                        print(message.strip(), flush=True)
+                    if json_mode:
+                        write_raw(message)
                     else:
-                        formatted = format_log_message(log_data, use_color)
-                        print(formatted, flush=True)
+                        write_line(format_message(log_data, message))
 
-                except json.JSONDecodeError:
+                except JSONDecodeError:
                     # Not valid JSON, print raw
-                    print(f"{colorize('RAW:', Colors.ERROR, use_color)} {message}", flush=True)
+                    raw = message.decode('utf-8', 'replace')
+                    write_line(f"{colorize('RAW:', Colors.ERROR, use_color)} {raw}")
 
     except websockets.exceptions.ConnectionClosed:
+        out.flush()
         print(f"\n{colorize('Connection closed by server', Colors.WARN, use_color)}")
         print(f"{colorize('Packets received:', Colors.BOLD, use_color)} {packets_received}")
         return packets_received
 
     except Exception as e:
+        out.flush()
         print(f"\n{colorize('Error:', Colors.ERROR, use_color)} {e}", file=sys.stderr)
         return packets_received
 
+    out.flush()
     return packets_received
 
 async def main_async(args):
@@ -398,7 +597,14 @@ def main():
 
     # Run async main
     try:
-        exit_code = asyncio.run(main_async(args))
+        if uvloop is None:
+            exit_code = asyncio.run(main_async(args))
+        elif sys.version_info >= (3, 11) and hasattr(uvloop, 'run'):
+            # uvloop.run() was added in uvloop 0.18
+            exit_code = uvloop.run(main_async(args))
+        else:
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+            exit_code = asyncio.run(main_async(args))
         sys.exit(exit_code)
     except KeyboardInterrupt:
         print("\nInterrupted")